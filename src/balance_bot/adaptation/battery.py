@@ -13,6 +13,14 @@ class BatteryEstimator:
         We compare current responsiveness against a baseline (established at startup).
         If responsiveness drops, we increase the 'compensation factor' to boost PWM.
     """
+    __slots__ = [
+        'config',
+        'samples_collected',
+        'baseline_responsiveness',
+        'current_responsiveness',
+        'compensation_factor',
+        'inv_compensation',
+    ]
 
     def __init__(self, config: BatteryConfig = BatteryConfig()):
         """
@@ -29,6 +37,8 @@ class BatteryEstimator:
         # Usage: FinalOutput = PIDOutput / CompensationFactor
         # Example: If factor is 0.8 (20% drop), we divide by 0.8 (multiply by 1.25).
         self.compensation_factor = 1.0
+        # Cached reciprocal so callers multiply instead of divide every tick.
+        self.inv_compensation = 1.0
 
     def update(self, pwm: float, angular_accel: float, loop_delta_time: float) -> float:
         """
@@ -80,5 +90,6 @@ class BatteryEstimator:
             self.config.factor_smoothing * target_factor
             + (1 - self.config.factor_smoothing) * self.compensation_factor
         )
+        self.inv_compensation = 1.0 / self.compensation_factor
 
         return self.compensation_factor
@@ -35,7 +35,7 @@ class RecoveryManager:
             # Logic from old main.py:
             # If Kp is high (normal operation) and we are leaning significantly, assume we were just picked up.
             if current_kp >= 1.0 and abs(current_pitch) > 5.0:
-                logger.info(f"-> Starting Soft Recovery from {current_pitch:.1f} deg")
+                logger.info("-> Starting Soft Recovery from %.1f deg", current_pitch)
                 self.recovering = True
                 self.ramp_setpoint = current_pitch
             else:
@@ -56,7 +56,7 @@ class RecoveryManager:
 
             # Check completion
             # If ramp is near zero and robot is near zero
-            if abs(self.ramp_setpoint) < 0.1 and abs(current_pitch) < 5.0:
+            if -0.1 < self.ramp_setpoint < 0.1 and -5.0 < current_pitch < 5.0:
                 logger.info("-> Recovery Complete.")
                 self.recovering = False
                 return None
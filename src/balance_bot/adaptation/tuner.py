@@ -1,4 +1,4 @@
-import statistics
+import math
 from collections import deque
 from itertools import pairwise
 from typing import NamedTuple
@@ -12,6 +12,11 @@ class TuningAdjustment(NamedTuple):
     kd: float
 
 
+# Shared "no change" result, returned on every non-analysis tick so callers can
+# test `adj is not NO_ADJUSTMENT` instead of comparing three floats.
+NO_ADJUSTMENT = TuningAdjustment(0.0, 0.0, 0.0)
+
+
 class ContinuousTuner:
     """
     Background process that monitors control performance and suggests PID tweaks.
@@ -34,6 +39,8 @@ class ContinuousTuner:
         self.cooldown_timer = 0
         self.current_scale = self.config.start_aggression_normal
         self.tick_counter = 0
+        self._crash_hi = config.crash_angle
+        self._crash_lo = -config.crash_angle
 
     def reset_aggression(self, first_run: bool) -> None:
         """Reset the tuning aggression scale based on run mode."""
@@ -56,31 +63,35 @@ class ContinuousTuner:
         # Safety: If falling/crashed, do not tune and reset history.
         # We use crash_angle (default 60.0) to allow tuning while resting on training wheels (~30-40 deg)
         # during the initial startup phase.
-        if abs(error) > self.config.crash_angle:
+        if error > self._crash_hi or error < self._crash_lo:
             self.errors.clear()
-            return TuningAdjustment(0.0, 0.0, 0.0)
+            return NO_ADJUSTMENT
 
         self.errors.append(error)
 
         # Decrement cooldown
         if self.cooldown_timer > 0:
             self.cooldown_timer -= 1
-            return TuningAdjustment(0.0, 0.0, 0.0)
+            return NO_ADJUSTMENT
 
         # Need full buffer to analyze
         if len(self.errors) < self.buffer_size:
-            return TuningAdjustment(0.0, 0.0, 0.0)
+            return NO_ADJUSTMENT
 
         # Optimization: Downsample expensive statistical analysis
         self.tick_counter += 1
         if self.tick_counter % self.config.analysis_interval != 0:
-            return TuningAdjustment(0.0, 0.0, 0.0)
+            return NO_ADJUSTMENT
 
         # Analyze History
-        mean_err = statistics.mean(self.errors)
-        try:
-            stdev_err = statistics.stdev(self.errors)
-        except statistics.StatisticsError:
+        # fsum-based mean/stdev: same results as the statistics module for this
+        # buffer, without its exact-fraction arithmetic (much slower on a Pi Zero).
+        errors = self.errors
+        n = len(errors)
+        mean_err = math.fsum(errors) / n
+        if n > 1:
+            stdev_err = math.sqrt(math.fsum((e - mean_err) ** 2 for e in errors) / (n - 1))
+        else:
             stdev_err = 0.0
 
         zero_crossings = self._count_zero_crossings()
@@ -121,13 +132,17 @@ class ContinuousTuner:
         if self.current_scale > self.config.min_aggression:
             self.current_scale *= self.config.aggression_decay
 
+        if not tuned:
+            return NO_ADJUSTMENT
         return TuningAdjustment(kp_nudge, ki_nudge, kd_nudge)
 
     def _count_zero_crossings(self) -> int:
         """Count how many times the signal crosses zero in the buffer."""
+        # Sign test by product: a pair crosses when it leaves a nonzero value
+        # for zero or the opposite sign (one multiply instead of four compares).
         crossings = 0
         for e1, e2 in pairwise(self.errors):
-            if (e1 > 0 and e2 <= 0) or (e1 < 0 and e2 >= 0):
+            if e1 * e2 <= 0.0 and e1 != 0.0:
                 crossings += 1
         return crossings
 
@@ -169,7 +184,7 @@ class BalancePointFinder:
             return 0.0
 
         # 5. Analyze
-        avg_output = statistics.mean(self.motor_history)
+        avg_output = math.fsum(self.motor_history) / len(self.motor_history)
         self.motor_history.clear()  # Reset buffer after analysis
 
         adjustment = 0.0
@@ -1,9 +1,10 @@
-import sys
+import gc
+import copy
 import time
+import signal
+import threading
 import logging
-import json
 import concurrent.futures
-from dataclasses import asdict
 
 from ..config import (
     CONFIG_FILE,
@@ -11,29 +12,52 @@ from ..config import (
     PIDParams,
     SYSTEM_TIMING,
 )
-from ..utils import RateLimiter, LogThrottler, setup_logging, check_force_calibration_flag
+from ..utils import (
+    RateLimiter,
+    LogThrottler,
+    setup_logging,
+    check_force_calibration_flag,
+    enable_realtime,
+    demote_thread,
+)
 from ..reflex.balance_core import BalanceCore, MotionRequest, TuningParams
 from ..adaptation.recovery import RecoveryManager
-from ..adaptation.tuner import ContinuousTuner, BalancePointFinder
+from ..adaptation.tuner import ContinuousTuner, BalancePointFinder, NO_ADJUSTMENT
 from ..adaptation.battery import BatteryEstimator
 from .leds import LedController
 from ..enums import Orientation, Direction
 
 logger = logging.getLogger(__name__)
 
+
+class ShutdownRequested(Exception):
+    """Raised by the startup routines when a signal stops them mid-sequence."""
+
+
+def _log_save_failure(future: concurrent.futures.Future) -> None:
+    """Done-callback for background config saves; nothing else inspects the future."""
+    exc = future.exception()
+    if exc is not None:
+        logger.error(f"Config save failed: {exc!r}")
+
+
 class Agent:
     """
     Tier 3: The Cortex.
     Orchestrates the robot's behavior, manages state, and schedules sub-systems.
     """
 
-    def __init__(self):
+    def __init__(self, force_tune: bool = False, force_calibration: bool = False):
+        """
+        :param force_tune: Start the tuner with first-run aggression (--tune).
+        :param force_calibration: Ignore saved config and rediscover (--force-calibration).
+        """
         setup_logging()
 
         # 1. Configuration
-        self.force_tune = "--tune" in sys.argv
+        self.force_tune = force_tune
         self.has_saved_config = CONFIG_FILE.exists()
-        force_calib = check_force_calibration_flag()
+        force_calib = check_force_calibration_flag(force_calibration)
 
         if force_calib:
             logger.info("Forcing calibration: Using default configuration.")
@@ -69,20 +93,39 @@ class Agent:
         self.led = LedController(self.config.led)
         self.battery_logger = LogThrottler(SYSTEM_TIMING.battery_log_interval)
 
+        # Constant after init (the tuner only touches PID gains and target angle)
+        self._low_bat_threshold = self.config.control.low_battery_log_threshold
+        self._balance_limit = self.config.tuner.balance_max_deviation
+
         # State
         self.running = True
+        self._shutdown = threading.Event()
         self.config_dirty = False
-        self.last_save_time = time.monotonic()
+        # Save throttling counts control ticks rather than reading the clock
+        self.last_save_tick = 0
+        self._save_ticks = max(1, round(SYSTEM_TIMING.save_interval / self.config.loop_time))
         self.ticks = 0
-        self.io_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self.io_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, initializer=demote_thread
+        )
+        # One pacer for every loop; each phase re-anchors it with reset()
+        self.rate = RateLimiter(1.0 / self.config.loop_time, spin=SYSTEM_TIMING.loop_spin_margin)
 
         # Pre-allocated zero tuning params for waiting/measuring loops
         self._zero_tuning = TuningParams(0.0, 0.0, 0.0, 0.0)
 
     def init(self) -> None:
         """Initialize hardware and signal readiness."""
-        # Core init happens in __init__ currently, but we can verify here?
-        pass
+        # Handlers can only be installed from the main thread, so not in __init__
+        signal.signal(signal.SIGINT, self._request_shutdown)
+        signal.signal(signal.SIGTERM, self._request_shutdown)
+        enable_realtime()
+
+    def _request_shutdown(self, signum: int, frame) -> None:
+        """Signal handler: stop every loop and wake any pending wait."""
+        logger.info(f"Received {signal.Signals(signum).name}. Shutting down.")
+        self.running = False
+        self._shutdown.set()
 
     def run(self) -> None:
         """
@@ -91,20 +134,33 @@ class Agent:
         # 1. Warmup
         logger.info("-> Warming up sensors...")
         self.led.signal_setup()
-        start_wait = time.monotonic()
-        while time.monotonic() - start_wait < SYSTEM_TIMING.setup_wait:
+        # Blinking runs on its own thread for the whole run, discovery included
+        self.led.start()
+        # Pace on the same fixed grid as the control loop so the filter sees the dt it assumes
+        self.rate.reset()
+        deadline = time.monotonic() + SYSTEM_TIMING.setup_wait
+        while self.running and time.monotonic() < deadline:
             # We must spin the core to settle the filter
             self.core.update(MotionRequest(), self._zero_tuning, self.config.loop_time)
-            self.led.update()
-            time.sleep(self.config.loop_time)
+            self.rate.sleep()
+
+        if self._shutdown.is_set():
+            self._stop_outputs()
+            return
 
         # 2. Calibration / Startup
-        if self.first_run or check_force_calibration_flag():
+        # first_run already folds in the force-calibration triggers
+        if self.first_run:
             try:
                 self._perform_discovery()
+            except ShutdownRequested:
+                # Interrupted by a signal: stop without saving a half-measured config
+                logger.info("-> Discovery interrupted by shutdown.")
+                self._stop_outputs()
+                return
             except Exception as e:
                 logger.error(f"Discovery Failed: {e}")
-                self.core.cleanup()
+                self._stop_outputs()
                 return
         else:
             # Normal Startup: Check if we need to Kick Up
@@ -117,9 +173,13 @@ class Agent:
                         self.config.pid.target_angle,
                         start_power=self.config.control.kickup_power
                     )
+                except ShutdownRequested:
+                    logger.info("-> Kick-Up interrupted by shutdown.")
+                    self._stop_outputs()
+                    return
                 except Exception as e:
                     logger.error(f"Kick-Up Failed: {e}")
-                    self.core.cleanup()
+                    self._stop_outputs()
                     return
 
         # 3. Main Loop
@@ -131,36 +191,66 @@ class Agent:
 
         self.led.signal_ready()
 
-        rate = RateLimiter(1.0 / self.config.loop_time)
+        # Discovery/kick-up may have run since warmup; start a fresh grid
+        self.rate.reset()
 
-        # Internal State tracking for Adaptation
-        last_pitch_rate = 0.0
         # Initialize dummy telemetry for the first cycle
         last_telemetry = None
 
-        # Pre-allocate TuningParams for high-frequency reuse
+        # Pre-allocate loop inputs for high-frequency reuse
         tuning_params = TuningParams(0.0, 0.0, 0.0, 0.0)
-
+        # Default Motion Request (Velocity 0)
+        motion_req = MotionRequest(velocity=0.0, turn_rate=0.0)
+
+        # Hoist hot lookups out of the loop. `pid` is the live PIDParams object,
+        # so updates from the tuner and balance finder are still seen through it.
+        pid = self.config.pid
+        loop_dt = self.config.loop_time
+        core_update = self.core.update
+        recovery_update = self.recovery.update
+        tuner_update = self.tuner.update
+        balance_update = self.balance_finder.update
+        battery = self.battery
+        battery_update = battery.update
+        battery_should_log = self.battery_logger.should_log
+        low_bat_threshold = self._low_bat_threshold
+        balance_limit = self._balance_limit
+        rate_sleep = self.rate.sleep
+        save_ticks = self._save_ticks
+        monotonic_ns = time.monotonic_ns
+
+        # The filter and PID integrate over the *measured* step, clamped so one
+        # long stall cannot dump a huge dt into the I-term.
+        dt_min = loop_dt * SYSTEM_TIMING.dt_min_factor
+        dt_max = loop_dt * SYSTEM_TIMING.dt_max_factor
+        dt = loop_dt
+        prev_ns = monotonic_ns() - round(loop_dt * 1e9)
+
+        # Collect startup garbage now and keep the cyclic GC out of the loop;
+        # the loop body allocates almost nothing, so refcounting covers it.
+        gc.collect()
+        gc.freeze()
+        gc.disable()
+
+        # Log calls in the loop use %-style args so formatting is deferred
+        # until a handler actually emits the record.
         try:
             while self.running:
                 self.ticks += 1
 
-                # Default Motion Request (Velocity 0)
-                motion_req = MotionRequest(velocity=0.0, turn_rate=0.0)
-
                 # --- PREPARE INPUTS (Adaptation Phase) ---
                 # Use data from the PREVIOUS frame to adjust parameters for THIS frame.
 
                 # Defaults
-                tune_kp = self.config.pid.kp
-                tune_ki = self.config.pid.ki
-                tune_kd = self.config.pid.kd
+                tune_kp = pid.kp
+                tune_ki = pid.ki
+                tune_kd = pid.kd
                 target_offset = 0.0
 
-                if last_telemetry:
+                if last_telemetry is not None:
                     # 1. Recovery Logic
                     # Returns an absolute target angle if recovering, or None.
-                    rec_target = self.recovery.update(
+                    rec_target = recovery_update(
                         last_telemetry.crashed,
                         last_telemetry.pitch_angle,
                         tune_kp
@@ -168,29 +258,29 @@ class Agent:
 
                     if rec_target is not None:
                         # Convert Absolute Target -> Offset
-                        target_offset = rec_target - self.config.pid.target_angle
+                        target_offset = rec_target - pid.target_angle
 
                     # 2. Continuous Tuning (Every tick or subsampled?)
                     # Tuner expects to run every tick to fill its buffer
                     # Error = Pitch - Target
                     # Note: We use the target from LAST frame (approximation)
-                    curr_error = last_telemetry.pitch_angle - self.config.pid.target_angle
+                    curr_error = last_telemetry.pitch_angle - pid.target_angle
 
                     # Only tune if not recovering
                     if rec_target is None:
-                        adj = self.tuner.update(curr_error)
-                        if adj.kp != 0 or adj.ki != 0 or adj.kd != 0:
-                            self.config.pid.kp = max(0.1, self.config.pid.kp + adj.kp)
-                            self.config.pid.ki = max(0.0, self.config.pid.ki + adj.ki)
-                            self.config.pid.kd = max(0.0, self.config.pid.kd + adj.kd)
+                        adj = tuner_update(curr_error)
+                        if adj is not NO_ADJUSTMENT:
+                            pid.kp = max(0.1, pid.kp + adj.kp)
+                            pid.ki = max(0.0, pid.ki + adj.ki)
+                            pid.kd = max(0.0, pid.kd + adj.kd)
                             self.config_dirty = True
                             logger.info(
-                                f"-> Tuned: P={self.config.pid.kp:.2f} I={self.config.pid.ki:.3f} D={self.config.pid.kd:.2f}"
+                                "-> Tuned: P=%.2f I=%.3f D=%.2f", pid.kp, pid.ki, pid.kd
                             )
                             # Update local vars
-                            tune_kp = self.config.pid.kp
-                            tune_ki = self.config.pid.ki
-                            tune_kd = self.config.pid.kd
+                            tune_kp = pid.kp
+                            tune_ki = pid.ki
+                            tune_kd = pid.kd
 
                     # 3. Balance Point Finding
                     # Runs only when balanced AND NOT MOVING
@@ -201,46 +291,36 @@ class Agent:
                         and motion_req.turn_rate == 0.0
                     ):
                         # Compensate motor output for battery to get "effort"
-                        effort = last_telemetry.motor_output / self.battery.compensation_factor
-                        bal_adj = self.balance_finder.update(effort, last_telemetry.pitch_rate)
+                        effort = last_telemetry.motor_output * battery.inv_compensation
+                        bal_adj = balance_update(effort, last_telemetry.pitch_rate)
 
                         if bal_adj != 0:
-                            new_target = self.config.pid.target_angle + bal_adj
-                            limit = self.config.tuner.balance_max_deviation
-                            if abs(new_target) <= limit: # Simplified check assuming 0 center
-                                self.config.pid.target_angle = new_target
+                            new_target = pid.target_angle + bal_adj
+                            if abs(new_target) <= balance_limit: # Simplified check assuming 0 center
+                                pid.target_angle = new_target
                                 self.config_dirty = True
-                                logger.info(f"-> Balance Corrected: Target={new_target:.2f}")
+                                logger.info("-> Balance Corrected: Target=%.2f", new_target)
 
                     # 4. Battery Estimation
-                    ang_accel = (last_telemetry.pitch_rate - last_pitch_rate) / self.config.loop_time
-                    last_pitch_rate = last_telemetry.pitch_rate
-
-                    comp_factor = self.battery.update(
+                    comp_factor = battery_update(
                         last_telemetry.motor_output,
-                        ang_accel,
-                        self.config.loop_time
+                        last_telemetry.ang_accel,
+                        dt
                     )
 
-                    if comp_factor < self.config.control.low_battery_log_threshold and self.battery_logger.should_log():
-                         logger.warning(f"-> Low Battery? Compensating: {int(comp_factor * 100)}%")
+                    if comp_factor < low_bat_threshold and battery_should_log():
+                         logger.warning("-> Low Battery? Compensating: %d%%", comp_factor * 100)
 
                 # --- TIER 3: BEHAVIOR (Cognition) ---
-                # Very simple "Wait" behavior for now.
-                if self.ticks % 10 == 0:
-                    self.led.update()
-                    if self.config_dirty and (time.monotonic() - self.last_save_time > SYSTEM_TIMING.save_interval):
-                        # Asynchronous Configuration Save
-                        try:
-                            config_snapshot = asdict(self.config)
-                            # Serialize in main thread to ensure consistency
-                            json_str = json.dumps(config_snapshot, indent=4)
-                            self.io_executor.submit(self._save_config_worker, json_str)
-
-                            self.last_save_time = time.monotonic()
-                            self.config_dirty = False
-                        except Exception as e:
-                            logger.error(f"Failed to initiate async config save: {e}")
+                # Very simple "Wait" behavior for now. (LED blinking runs on its own thread.)
+                if self.config_dirty and self.ticks - self.last_save_tick >= save_ticks:
+                    # Asynchronous Configuration Save.
+                    # Only the shallow copy happens here, so the snapshot stays consistent;
+                    # asdict/json/disk I/O all run on the I/O thread.
+                    save_future = self.io_executor.submit(self._snapshot_config().save)
+                    save_future.add_done_callback(_log_save_failure)
+                    self.last_save_tick = self.ticks
+                    self.config_dirty = False
 
                 # --- TIER 1: REFLEX (Execution) ---
                 # Update existing object to avoid allocation
@@ -249,31 +329,50 @@ class Agent:
                 tuning_params.kd = tune_kd
                 tuning_params.target_angle_offset = target_offset
 
-                last_telemetry = self.core.update(
+                now_ns = monotonic_ns()
+                dt = (now_ns - prev_ns) * 1e-9
+                prev_ns = now_ns
+                if dt < dt_min:
+                    dt = dt_min
+                elif dt > dt_max:
+                    dt = dt_max
+
+                last_telemetry = core_update(
                     motion_req,
                     tuning_params,
-                    self.config.loop_time,
-                    battery_compensation=self.battery.compensation_factor
+                    dt,
+                    battery_gain=battery.inv_compensation
                 )
 
-                rate.sleep()
+                rate_sleep()
 
         except KeyboardInterrupt:
             logger.info("Keyboard Interrupt.")
         finally:
-            self.core.cleanup()
-            self.led.signal_off()
+            # Hand the frozen startup objects back and collect, so repeated
+            # run() calls in one process do not pile up in the permanent generation
+            gc.enable()
+            gc.unfreeze()
+            gc.collect()
+            self._stop_outputs()
+            # Drain pending async saves first so they cannot overwrite the final one
+            self.io_executor.shutdown(wait=True)
             if self.config_dirty:
                 self.config.save()
-            self.io_executor.shutdown(wait=True)
 
-    def _save_config_worker(self, json_content: str) -> None:
-        """Background worker to write config to disk."""
-        try:
-            CONFIG_FILE.write_text(json_content)
-            logger.info("Config saved (Async).")
-        except Exception as e:
-            logger.error(f"Error saving config asynchronously: {e}")
+    def _stop_outputs(self) -> None:
+        """Stop the motors and the LED thread, and switch the LED off."""
+        self.core.cleanup()
+        self.led.stop()
+        self.led.signal_off()
+        self.led.close()
+
+    def _snapshot_config(self) -> RobotConfig:
+        """Copy the parts of the config the loop mutates (PID gains, kick-up power)."""
+        snapshot = copy.copy(self.config)
+        snapshot.pid = copy.copy(self.config.pid)
+        snapshot.control = copy.copy(self.config.control)
+        return snapshot
 
     def _perform_discovery(self) -> None:
         logger.info(">>> STARTING AUTONOMOUS DISCOVERY <<<")
@@ -352,7 +451,7 @@ class Agent:
         """Wait for the robot to settle (low pitch rate)."""
         logger.info("-> Waiting for settle...")
         end_time = time.monotonic() + duration
-        while True:
+        while self.running:
             # Keep filter alive
             telemetry = self.core.update(MotionRequest(), self._zero_tuning, self.config.loop_time)
 
@@ -364,26 +463,26 @@ class Agent:
                     # Extend wait if still moving
                     end_time = time.monotonic() + 0.5
 
-            time.sleep(self.config.loop_time)
+            self._shutdown.wait(self.config.loop_time)
 
     def _measure_stable_angle(self, duration: float = 1.0) -> float:
         """Measure average pitch over a duration."""
         end_time = time.monotonic() + duration
         pitch_sum = 0.0
         count = 0
-        while time.monotonic() < end_time:
+        while self.running and time.monotonic() < end_time:
             telemetry = self.core.update(MotionRequest(), self._zero_tuning, self.config.loop_time)
             pitch_sum += telemetry.pitch_angle
             count += 1
-            time.sleep(self.config.loop_time)
+            self._shutdown.wait(self.config.loop_time)
         return pitch_sum / max(1, count)
 
     def _sleep_with_update(self, duration: float) -> None:
         """Sleep for duration while keeping the core filter updated."""
         end_time = time.monotonic() + duration
-        while time.monotonic() < end_time:
+        while self.running and time.monotonic() < end_time:
             self.core.update(MotionRequest(), self._zero_tuning, self.config.loop_time)
-            time.sleep(self.config.loop_time)
+            self._shutdown.wait(self.config.loop_time)
 
     def _incremental_flop(self, target_side: Orientation) -> float:
         """
@@ -402,7 +501,7 @@ class Agent:
         step = 5.0
         max_power = 100.0
 
-        while power <= max_power:
+        while self.running and power <= max_power:
             self._wait_for_settle()
 
             logger.info(f"-> Attempting Flop to {target_side.upper()} with Power {power:.1f}...")
@@ -415,7 +514,7 @@ class Agent:
             # Wait for result
             end_wait = time.monotonic() + 1.5
             success = False
-            while time.monotonic() < end_wait:
+            while self.running and time.monotonic() < end_wait:
                 telem = self.core.update(MotionRequest(), self._zero_tuning, self.config.loop_time)
 
                 # Check if we crossed the vertical significantly
@@ -425,7 +524,7 @@ class Agent:
                    (target_side == Orientation.BACK and telem.pitch_angle < -10.0):
                     success = True
                     break
-                time.sleep(self.config.loop_time)
+                self._shutdown.wait(self.config.loop_time)
 
             if success:
                 logger.info(f"-> Flop Success at Power {power:.1f}")
@@ -435,6 +534,8 @@ class Agent:
             logger.info("-> Failed. Retrying...")
             power += step
 
+        if not self.running:
+            raise ShutdownRequested()
         raise RuntimeError(f"Failed to flop to {target_side} even at max power.")
 
     def _incremental_kickup(self, target_angle: float, start_power: float) -> None:
@@ -456,7 +557,7 @@ class Agent:
 
         logger.info(f"-> Starting Incremental Kick-Up from {start_label}. Target: {target_angle:.2f}")
 
-        while power <= max_power:
+        while self.running and power <= max_power:
             self._wait_for_settle()
 
             # Check if we are still at the starting limit
@@ -509,7 +610,7 @@ class Agent:
             )
 
             # We want to run this catch loop for enough time to stabilize
-            while time.monotonic() - catch_start < 2.5:
+            while self.running and time.monotonic() - catch_start < 2.5:
                 # We are now in a mini control loop
                 telem = self.core.update(MotionRequest(), catch_params, self.config.loop_time)
 
@@ -527,7 +628,7 @@ class Agent:
                      # For now, just let the PID try its best.
                      pass
 
-                time.sleep(self.config.loop_time)
+                self._shutdown.wait(self.config.loop_time)
 
             # Check result after catch attempt
             final_error = abs(self.core.pitch - target_angle)
@@ -542,4 +643,6 @@ class Agent:
             logger.info("-> Catch Failed. Retrying...")
             power += step
 
+        if not self.running:
+            raise ShutdownRequested()
         raise RuntimeError("Failed to Kick-Up.")
@@ -1,8 +1,11 @@
+import os
 import time
 import logging
+import threading
 from pathlib import Path
 
 from ..config import LedConfig
+from ..utils import demote_thread
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +19,9 @@ class LedController:
      - TUNING: Slow blink (Auto-tuning in progress).
      - ON: Solid On (Active Balancing).
      - OFF: LED Off.
+
+    Blinking is serviced by a background thread (start/stop), so the control
+    loop never spends time on LED I/O.
     """
 
     def __init__(self, config: LedConfig = LedConfig()):
@@ -25,10 +31,20 @@ class LedController:
         """
         self.config = config
         self.led_path: Path | None = self._find_led_path()
+        self._led_fd: int | None = self._open_led()
         self.mode = "OFF"
         self.last_toggle = 0.0
         self.is_on = False
         self.blink_interval = 0.0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._mode_handlers = {
+            "SETUP": self._update_blink,
+            "TUNING": self._update_blink,
+            "ON": self._update_on,
+            "OFF": self._update_off,
+        }
 
         # Turn off initially
         self.set_led(False)
@@ -44,60 +60,109 @@ class LedController:
         )
         return next((p for p in candidates if p.exists()), None)
 
+    def _open_led(self) -> int | None:
+        """
+        Open the brightness file once and keep the descriptor, so toggling
+        is a single write instead of a stat/open/write/close per blink.
+        """
+        if not self.led_path:
+            return None
+        try:
+            return os.open(self.led_path, os.O_WRONLY)
+        except OSError:
+            # Fail silently if permissions are missing (common in non-root dev)
+            return None
+
     def set_led(self, on: bool) -> None:
         """
         Hardware primitive to switch LED state.
         :param on: True for ON (Brightness 1/255), False for OFF (0).
         """
         self.is_on = on
-        if not self.led_path:
+        if self._led_fd is None:
             return
 
-        val = "1" if on else "0"
         try:
-            self.led_path.write_text(val)
-        except (PermissionError, OSError):
-            # Fail silently if permissions are missing (common in non-root dev)
+            os.pwrite(self._led_fd, b"1" if on else b"0", 0)
+        except OSError:
             pass
 
+    def close(self) -> None:
+        """Stop the background thread and release the LED file descriptor."""
+        self.stop()
+        if self._led_fd is not None:
+            os.close(self._led_fd)
+            self._led_fd = None
+
+    def start(self) -> None:
+        """Start the background thread that services blinking."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._worker, name="led", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background thread (LED is left in its current state)."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def _worker(self) -> None:
+        # Blinking must never compete with the control loop for the CPU
+        demote_thread()
+        while not self._stop.wait(self.config.update_interval):
+            self.update()
+
     def signal_setup(self) -> None:
         """Set mode to SETUP (Fast Blink)."""
-        if self.mode != "SETUP":
-            self.mode = "SETUP"
-            self.blink_interval = self.config.setup_blink_interval
+        with self._lock:
+            if self.mode != "SETUP":
+                self.mode = "SETUP"
+                self.blink_interval = self.config.setup_blink_interval
 
     def signal_tuning(self) -> None:
         """Set mode to TUNING (Slow Blink)."""
-        if self.mode != "TUNING":
-            self.mode = "TUNING"
-            self.blink_interval = self.config.tuning_blink_interval
+        with self._lock:
+            if self.mode != "TUNING":
+                self.mode = "TUNING"
+                self.blink_interval = self.config.tuning_blink_interval
 
     def signal_ready(self) -> None:
         """Set mode to ON (Solid)."""
-        self.mode = "ON"
-        self.set_led(True)
+        with self._lock:
+            self.mode = "ON"
+            self.set_led(True)
 
     def signal_off(self) -> None:
         """Set mode to OFF."""
-        self.mode = "OFF"
-        self.set_led(False)
+        with self._lock:
+            self.mode = "OFF"
+            self.set_led(False)
 
     def update(self) -> None:
         """
         Periodic update function to handle blinking.
-        Should be called inside the main loop.
+        Called by the background thread; may also be called directly.
         """
-        if self.mode in ["SETUP", "TUNING"]:
-            now = time.monotonic()
-            if now - self.last_toggle > self.blink_interval:
-                self.set_led(not self.is_on)
-                self.last_toggle = now
-        elif self.mode == "ON":
-            if not self.is_on:
-                self.set_led(True)
-        elif self.mode == "OFF":
-            if self.is_on:
-                self.set_led(False)
+        with self._lock:
+            self._mode_handlers[self.mode]()
+
+    def _update_blink(self) -> None:
+        now = time.monotonic()
+        if now - self.last_toggle > self.blink_interval:
+            self.set_led(not self.is_on)
+            self.last_toggle = now
+
+    def _update_on(self) -> None:
+        if not self.is_on:
+            self.set_led(True)
+
+    def _update_off(self) -> None:
+        if self.is_on:
+            self.set_led(False)
 
     def _blink(self, count: int, on_time: float, off_time: float) -> None:
         """
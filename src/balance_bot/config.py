@@ -1,3 +1,4 @@
+import os
 import json
 import logging
 from contextlib import contextmanager
@@ -198,6 +199,9 @@ class LedConfig:
         * UOM: Seconds
     :param countdown_pause_time: Pause between countdown numbers.
         * UOM: Seconds
+    :param update_interval: Period of the background blink thread.
+        * UOM: Seconds
+        * Impact: Must be shorter than the fastest blink interval.
     """
     setup_blink_interval: float = 0.05
     tuning_blink_interval: float = 0.25
@@ -207,6 +211,7 @@ class LedConfig:
     countdown_blink_on_time: float = 0.2
     countdown_blink_off_time: float = 0.2
     countdown_pause_time: float = 0.5
+    update_interval: float = 0.02
 
 
 @dataclass
@@ -252,11 +257,20 @@ class SystemTiming:
         * UOM: Seconds
     :param battery_log_interval: Min interval between battery log messages.
         * UOM: Seconds
+    :param loop_spin_margin: Final slice of each control tick that is busy-waited instead of slept.
+        * UOM: Seconds
+        * Impact: Larger = less wake-up jitter but more CPU burned; 0 disables spinning.
+    :param dt_min_factor: Lower clamp on the measured control dt, as a multiple of loop_time.
+    :param dt_max_factor: Upper clamp on the measured control dt, as a multiple of loop_time.
+        * Impact: Bounds the I-term and filter step after a stall (overload guard).
     """
     setup_wait: float = 2.0
     calibration_pause: float = 1.0
     save_interval: float = 30.0
     battery_log_interval: float = 5.0
+    loop_spin_margin: float = 0.0005
+    dt_min_factor: float = 0.5
+    dt_max_factor: float = 3.0
 
 
 SYSTEM_TIMING = SystemTiming()
@@ -288,6 +302,20 @@ def temp_pid_overrides(pid_params: PIDParams, **overrides):
             setattr(pid_params, k, v)
 
 
+def _fsync_dir(path: Path) -> None:
+    """Flush a directory entry (e.g. after a rename) to disk. Best effort."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
 @dataclass
 class RobotConfig:
     """
@@ -427,9 +455,27 @@ class RobotConfig:
         )
 
     def save(self) -> None:
-        """Serialize and save the current configuration to disk."""
+        """
+        Serialize and save the current configuration to disk.
+        Skips the write when the file already holds identical content, so
+        periodic saves with unchanged gains do not rewrite the SD card.
+        The new content is written to a sibling temp file and renamed over the
+        old one, so a crash mid-write never leaves a truncated config behind.
+        The temp file (and then its directory) is fsynced around the rename so
+        a power cut cannot publish a rename whose data never reached the card.
+        """
+        text = json.dumps(asdict(self), indent=4)
         try:
-            CONFIG_FILE.write_text(json.dumps(asdict(self), indent=4))
+            if CONFIG_FILE.exists() and CONFIG_FILE.read_text() == text:
+                logger.debug("Config unchanged; skipping save.")
+                return
+            tmp_file = CONFIG_FILE.with_name(CONFIG_FILE.name + ".tmp")
+            with open(tmp_file, "w") as f:
+                f.write(text)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, CONFIG_FILE)
+            _fsync_dir(CONFIG_FILE.parent)
             logger.info("Config saved.")
         except OSError as e:
             logger.error(f"Error saving config: {e}")
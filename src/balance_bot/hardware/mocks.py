@@ -1,5 +1,5 @@
-import os
 import math
+import time
 
 
 class MockPiconZero:
@@ -25,33 +25,47 @@ class MockPiconZero:
 
 
 class MockMPU6050:
+    # Operators can tilt the simulated robot by writing degrees to this file
+    PITCH_FILE = "mock_pitch.txt"
+    # The file is re-checked at most this often (seconds), not on every read
+    POLL_INTERVAL = 0.5
+
     def __init__(self, address: int):
         self.address = address
+        self._next_poll = 0.0
+        self._pitch: float | None = None
+        self._accel = {"x": 0.0, "y": 0.0, "z": 9.8}
         print(f"[MockMPU6050] init at {address}")
 
-    def get_accel_data(self) -> dict[str, float]:
+    def _read_pitch_file(self) -> float:
         # Default vertical
         pitch = 0.0
 
         # Check for external override file
-        if os.path.exists("mock_pitch.txt"):
-            try:
-                with open("mock_pitch.txt", "r") as f:
-                    content = f.read().strip()
-                    if content:
-                        pitch = float(content)
-            except (ValueError, OSError):
-                pass
-
-        # Convert pitch (degrees) to accel vector (assuming Y is forward)
-        # pitch = atan2(y, z)
-        # y = sin(pitch) * 9.8
-        # z = cos(pitch) * 9.8
-        rad = math.radians(pitch)
-        y = math.sin(rad) * 9.8
-        z = math.cos(rad) * 9.8
-
-        return {"x": 0.0, "y": y, "z": z}
+        try:
+            with open(self.PITCH_FILE, "r") as f:
+                content = f.read().strip()
+                if content:
+                    pitch = float(content)
+        except (ValueError, OSError):
+            pass
+        return pitch
+
+    def get_accel_data(self) -> dict[str, float]:
+        now = time.monotonic()
+        if now >= self._next_poll:
+            self._next_poll = now + self.POLL_INTERVAL
+            pitch = self._read_pitch_file()
+            if pitch != self._pitch:
+                self._pitch = pitch
+                # Convert pitch (degrees) to accel vector (assuming Y is forward)
+                # pitch = atan2(y, z)
+                # y = sin(pitch) * 9.8
+                # z = cos(pitch) * 9.8
+                rad = math.radians(pitch)
+                self._accel = {"x": 0.0, "y": math.sin(rad) * 9.8, "z": math.cos(rad) * 9.8}
+
+        return self._accel
 
     def get_gyro_data(self) -> dict[str, float]:
         return {"x": 0.0, "y": 0.0, "z": 0.0}
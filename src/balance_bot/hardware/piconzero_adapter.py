@@ -6,8 +6,16 @@ class PiconZeroAdapter:
     Adapter to wrap the module-based piconzero driver into a class
     compatible with the MotorDriver protocol.
     """
+    # set_motors() calls between forced re-sends of unchanged channels, in case
+    # the board lost a value (brown-out reset, silently dropped write)
+    RESYNC_INTERVAL = 50
+
     def __init__(self, bus_number=1):
         self.bus_number = bus_number
+        # Last value the board acknowledged per channel (None = unknown, must
+        # write). Cleared before every write so a failed one forces a resend.
+        self._motor_vals: list[int | None] = [None, None]
+        self._resync_countdown = self.RESYNC_INTERVAL
 
         # piconzero module initializes 'bus = smbus.SMBus(1)' at import time.
         # If we need a different bus, we must patch the global variable.
@@ -33,14 +41,18 @@ class PiconZeroAdapter:
     def init(self) -> None:
         """Initialize the motor driver hardware."""
         pz.init()
+        self._motor_vals = [None, None]
 
     def cleanup(self) -> None:
         """Release hardware resources."""
         pz.cleanup()
+        self._motor_vals = [None, None]
 
     def stop(self) -> None:
         """Stop all motors immediately."""
+        self._motor_vals = [None, None]
         pz.stop()
+        self._motor_vals = [0, 0]
 
     def set_retries(self, retries: int) -> None:
         """Set the number of I2C retries."""
@@ -52,14 +64,30 @@ class PiconZeroAdapter:
         :param motor: Motor channel index (0 or 1).
         :param value: Speed (-100 to 100).
         """
+        self._motor_vals[motor] = None
         pz.setMotor(motor, value)
+        self._motor_vals[motor] = value
 
     def set_motors(self, motor_0_val: int, motor_1_val: int) -> None:
         """
         Set speed for both motors.
-        The module doesn't support block write for motors, so we call setMotor twice.
+        The module doesn't support block write for motors, so we call setMotor
+        per channel, skipping channels already at the requested value (e.g.
+        saturated or stopped) to save an I2C transaction. Every
+        RESYNC_INTERVAL calls both channels are written regardless.
         :param motor_0_val: Speed for Motor 0 (-100 to 100).
         :param motor_1_val: Speed for Motor 1 (-100 to 100).
         """
-        pz.setMotor(0, motor_0_val)
-        pz.setMotor(1, motor_1_val)
+        vals = self._motor_vals
+        self._resync_countdown -= 1
+        if self._resync_countdown <= 0:
+            self._resync_countdown = self.RESYNC_INTERVAL
+            vals[0] = vals[1] = None
+        if motor_0_val != vals[0]:
+            vals[0] = None
+            pz.setMotor(0, motor_0_val)
+            vals[0] = motor_0_val
+        if motor_1_val != vals[1]:
+            vals[1] = None
+            pz.setMotor(1, motor_1_val)
+            vals[1] = motor_1_val
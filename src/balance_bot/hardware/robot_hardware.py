@@ -1,9 +1,10 @@
 import os
+import struct
 import logging
 from typing import Protocol, runtime_checkable, Any
 from dataclasses import dataclass
 
-from ..utils import clamp, calculate_pitch, Vector3
+from ..utils import calculate_pitch, Vector3
 from ..diagnostics import get_i2c_failure_report
 from ..config import (
     BALANCING_THRESHOLD,
@@ -17,11 +18,21 @@ logger = logging.getLogger(__name__)
 MOTOR_MIN_OUTPUT = -100
 MOTOR_MAX_OUTPUT = 100
 
+# MPU6050 burst read: ACCEL_XOUT_H..GYRO_ZOUT_L is one contiguous 14 byte block
+MPU6050_DATA_START = 0x3B
+MPU6050_DATA_LEN = 14
+_MPU6050_FRAME = struct.Struct(">7h")  # ax, ay, az, temp, gx, gy, gz
+_GRAVITY_MS2 = 9.80665
+_ACCEL_LSB_PER_G = {2: 16384.0, 4: 8192.0, 8: 4096.0, 16: 2048.0}
+_GYRO_LSB_PER_DPS = {250: 131.0, 500: 65.5, 1000: 32.8, 2000: 16.4}
 
-@dataclass(frozen=True)
+
+@dataclass(slots=True)
 class IMUReading:
     """
-    Immutable data structure for converted IMU readings.
+    Data structure for converted IMU readings.
+    RobotHardware fills a single instance in place on every read, so callers
+    must copy out any values they need beyond the current tick.
 
     :param pitch_angle: Calculated pitch angle in degrees (Zero = Upright).
     :param pitch_rate: Angular velocity around pitch axis in deg/s.
@@ -101,6 +112,12 @@ class IMUDriver(Protocol):
 class MPU6050Adapter:
     """
     Adapter for the mpu6050 library class to match IMUDriver protocol.
+
+    The library reads each axis as a separate word and re-reads the range
+    register on every call (14 I2C transactions per accel+gyro pair).
+    This adapter reads the range once and fetches all six axes in a single
+    burst; get_accel_data performs the read and stages the gyro half for
+    the get_gyro_data call that follows it.
     """
 
     def __init__(self, sensor_instance: Any):
@@ -109,14 +126,40 @@ class MPU6050Adapter:
         :param sensor_instance: Instance of mpu6050 class.
         """
         self.sensor = sensor_instance
+        self._bus = sensor_instance.bus
+        self._address = sensor_instance.address
+        self._accel_scale = _GRAVITY_MS2 / _ACCEL_LSB_PER_G.get(
+            sensor_instance.read_accel_range(), 16384.0
+        )
+        self._gyro_scale = 1.0 / _GYRO_LSB_PER_DPS.get(
+            sensor_instance.read_gyro_range(), 131.0
+        )
+        self._gyro: Vector3 | None = None
+
+    def _read_frame(self) -> tuple[int, ...]:
+        """Burst read the accel, temperature and gyro registers."""
+        data = self._bus.read_i2c_block_data(
+            self._address, MPU6050_DATA_START, MPU6050_DATA_LEN
+        )
+        return _MPU6050_FRAME.unpack(bytes(data))
 
     def get_accel_data(self) -> Vector3:
-        """Get accelerometer data."""
-        return self.sensor.get_accel_data()
+        """Get accelerometer data (m/s^2), staging the matching gyro sample."""
+        ax, ay, az, _, gx, gy, gz = self._read_frame()
+        a = self._accel_scale
+        g = self._gyro_scale
+        self._gyro = {"x": gx * g, "y": gy * g, "z": gz * g}
+        return {"x": ax * a, "y": ay * a, "z": az * a}
 
     def get_gyro_data(self) -> Vector3:
-        """Get gyroscope data."""
-        return self.sensor.get_gyro_data()
+        """Get gyroscope data (deg/s) from the last burst, or read a fresh one."""
+        gyro = self._gyro
+        if gyro is None:
+            _, _, _, _, gx, gy, gz = self._read_frame()
+            g = self._gyro_scale
+            return {"x": gx * g, "y": gy * g, "z": gz * g}
+        self._gyro = None
+        return gyro
 
 
 class RobotHardware:
@@ -207,6 +250,9 @@ class RobotHardware:
         self._last_accel = {"x": 0.0, "y": 0.0, "z": 0.0}
         self._last_gyro = {"x": 0.0, "y": 0.0, "z": 0.0}
 
+        # Reused by read_imu_converted to avoid a fresh allocation per tick
+        self._reading = IMUReading(0.0, 0.0, 0.0, 0.0, 0.0)
+
         self.pz: MotorDriver
         self.sensor: IMUDriver
 
@@ -303,7 +349,7 @@ class RobotHardware:
         except OSError:
             self._imu_consecutive_errors += 1
             if self._imu_consecutive_errors > self.imu_max_retries:
-                logger.error(f"IMU Failed {self._imu_consecutive_errors} times in a row. Raising Error.")
+                logger.error("IMU Failed %d times in a row. Raising Error.", self._imu_consecutive_errors)
                 raise
 
             # If I2C fails (noise), return the last known good values
@@ -322,10 +368,20 @@ class RobotHardware:
         4. Calculate Angle via atan2(forward, vertical).
         5. Return IMUReading.
 
-        :return: IMUReading object containing pitch angle and rates.
+        :return: The shared IMUReading, updated in place with pitch angle and rates.
         """
         accel, gyro = self.read_imu_raw()
+        return self.convert_imu(accel, gyro)
 
+    def convert_imu(self, accel: Vector3, gyro: Vector3) -> IMUReading:
+        """
+        Convert an already-read raw sample (steps 2-5 of read_imu_converted).
+        Lets callers that also need the raw axes use a single bus read.
+
+        :param accel: Raw accelerometer data from read_imu_raw.
+        :param gyro: Raw gyroscope data from read_imu_raw.
+        :return: The shared IMUReading, updated in place with pitch angle and rates.
+        """
         # Get raw values based on config
         accel_forward = accel[self.accel_forward_axis]
         accel_vertical = accel[self.accel_vertical_axis]
@@ -360,13 +416,13 @@ class RobotHardware:
         # Calculate angle of side vector relative to vertical
         roll_angle = calculate_pitch(accel_roll, accel_vertical)
 
-        return IMUReading(
-            pitch_angle=acc_angle,
-            pitch_rate=gyro_rate,
-            yaw_rate=yaw_rate,
-            roll_angle=roll_angle,
-            roll_rate=roll_rate
-        )
+        reading = self._reading
+        reading.pitch_angle = acc_angle
+        reading.pitch_rate = gyro_rate
+        reading.yaw_rate = yaw_rate
+        reading.roll_angle = roll_angle
+        reading.roll_rate = roll_rate
+        return reading
 
     def set_motor_retries(self, retries: int) -> None:
         """Set the I2C retry count for the motor driver."""
@@ -383,9 +439,17 @@ class RobotHardware:
         if self.invert_r:
             right = -right
 
-        # Use helper clamp, cast to int for driver
-        left_val = int(clamp(left, MOTOR_MIN_OUTPUT, MOTOR_MAX_OUTPUT))
-        right_val = int(clamp(right, MOTOR_MIN_OUTPUT, MOTOR_MAX_OUTPUT))
+        # Saturate inline (called every tick), cast to int for driver
+        left_val = (
+            MOTOR_MIN_OUTPUT if left < MOTOR_MIN_OUTPUT
+            else MOTOR_MAX_OUTPUT if left > MOTOR_MAX_OUTPUT
+            else int(left)
+        )
+        right_val = (
+            MOTOR_MIN_OUTPUT if right < MOTOR_MIN_OUTPUT
+            else MOTOR_MAX_OUTPUT if right > MOTOR_MAX_OUTPUT
+            else int(right)
+        )
 
         # Map logical Left/Right to Physical 0/1
         val_0 = 0
@@ -1,51 +1,71 @@
 import os
-import sys
+import argparse
 import traceback
-import importlib.metadata
-from dataclasses import asdict
-from .diagnostics import run_diagnostics
-from .wiring_check import WiringCheck
-from .movement_check import MovementCheck
-from .behavior.agent import Agent
 from .utils import setup_logging, get_captured_logs
-from .jules_client import JulesClient
+
+# Mode-specific modules are imported inside their branch: each mode pays only for
+# what it uses, and --diagnose still starts when hardware libraries are missing.
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse the command line once; everything downstream reads the namespace."""
+    parser = argparse.ArgumentParser(prog="balance-bot")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--diagnose", action="store_true", help="Check environment and dependencies.")
+    mode.add_argument("--check-wiring", action="store_true", help="Interactive wiring/axis discovery.")
+    mode.add_argument("--confirm-wiring", action="store_true", help="Verify wiring with movement tests.")
+    parser.add_argument("--tune", action="store_true", help="Start with first-run tuning aggression.")
+    parser.add_argument("--force-calibration", action="store_true", help="Ignore saved config and rediscover.")
+    parser.add_argument("--allow-mocks", action="store_true", help="Fall back to mock hardware.")
+    parser.add_argument("--auto-fix", action="store_true", help="Report crashes to Jules.")
+    return parser.parse_args(argv)
 
 
 def main() -> None:
     """Entry point for the robot control application."""
+    args = parse_args()
+
     # Ensure logging is set up early to capture imports/startup
     setup_logging()
 
     # Handle Mock Fallback Flag
-    if "--allow-mocks" in sys.argv:
+    if args.allow_mocks:
         os.environ["ALLOW_MOCK_FALLBACK"] = "1"
 
     try:
-        if "--diagnose" in sys.argv:
+        if args.diagnose:
+            from .diagnostics import run_diagnostics
             run_diagnostics()
             return
 
-        if "--check-wiring" in sys.argv:
+        if args.check_wiring:
+            from .wiring_check import WiringCheck
             try:
                 WiringCheck().run()
             except KeyboardInterrupt:
                 pass
             return
 
-        if "--confirm-wiring" in sys.argv:
+        if args.confirm_wiring:
+            from .movement_check import MovementCheck
             try:
                 MovementCheck().run()
             except KeyboardInterrupt:
                 pass
             return
 
-        bot = Agent()
+        from .behavior.agent import Agent
+        bot = Agent(force_tune=args.tune, force_calibration=args.force_calibration)
         bot.init()
         bot.run()
 
     except Exception as e:
         # Check if Auto-Fix is requested
-        if "--auto-fix" in sys.argv:
+        if args.auto_fix:
+            import importlib.metadata
+            from dataclasses import asdict
+            from .jules_client import JulesClient
+
             print("\n!!! CRASH DETECTED !!!")
             print("Auto-Fix enabled. Gathering data for Jules...")
 
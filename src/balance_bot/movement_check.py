@@ -1,12 +1,16 @@
 import time
 import logging
 import sys
-from .config import RobotConfig
+from .config import RobotConfig, SYSTEM_TIMING
 from .hardware.robot_hardware import RobotHardware
-from .utils import analyze_dominance
+from .utils import analyze_dominance, RateLimiter
 
 logger = logging.getLogger(__name__)
 
+SAMPLE_RATE_HZ = 100
+# Bound the time a dead bus can stall a 10 ms sample (driver default is 10)
+MOTOR_I2C_RETRIES = 3
+
 class MovementCheck:
     """
     Automated sequence to verify movement and wiring logic.
@@ -37,6 +41,10 @@ class MovementCheck:
             imu_i2c_bus=self.config.imu_i2c_bus,
         )
         self.hw.init()
+        self.hw.set_motor_retries(MOTOR_I2C_RETRIES)
+        # Samples are taken on a fixed deadline grid, so the yaw integration in
+        # turn_90 does not pick up sleep() overshoot every iteration.
+        self.rate = RateLimiter(SAMPLE_RATE_HZ, spin=SYSTEM_TIMING.loop_spin_margin)
         print(">>> Hardware Initialized.")
 
     def run(self):
@@ -82,26 +90,37 @@ class MovementCheck:
 
         # Monitor Accelerometer
         fwd_axis = self.config.accel_forward_axis.value # e.g. "z"
-        min_vals = {k: float('inf') for k in ['x','y','z']}
-        max_vals = {k: float('-inf') for k in ['x','y','z']}
+        # Per-axis scalar extremes (no dict work per sample)
+        min_x = min_y = min_z = float('inf')
+        max_x = max_y = max_z = float('-inf')
 
         start_time = time.monotonic()
+        self.rate.reset()
 
         while (time.monotonic() - start_time) < duration:
             # Read Raw Data
             accel, _ = self.hw.read_imu_raw()
-            for k in accel:
-                v = accel[k]
-                if v < min_vals[k]:
-                    min_vals[k] = v
-                if v > max_vals[k]:
-                    max_vals[k] = v
-            time.sleep(0.01)
+            x = accel["x"]
+            y = accel["y"]
+            z = accel["z"]
+            if x < min_x:
+                min_x = x
+            if x > max_x:
+                max_x = x
+            if y < min_y:
+                min_y = y
+            if y > max_y:
+                max_y = y
+            if z < min_z:
+                min_z = z
+            if z > max_z:
+                max_z = z
+            self.rate.sleep()
 
         self.hw.stop()
 
         # Calculate Deltas
-        deltas = {k: max_vals[k] - min_vals[k] for k in ['x','y','z']}
+        deltas = {"x": max_x - min_x, "y": max_y - min_y, "z": max_z - min_z}
 
         # Verify Dominance
         _, _, success = analyze_dominance(deltas, "Forward Acceleration", expected_axis=fwd_axis)
@@ -130,14 +149,13 @@ class MovementCheck:
         current_angle = 0.0
 
         yaw_axis = self.config.gyro_yaw_axis.value
-        all_axes = ["x", "y", "z"]
 
-        # Track mean absolute rates
-        rate_sums = {k: 0.0 for k in all_axes}
+        # Track mean absolute rates (per-axis scalars; no dict work per sample)
+        sum_x = sum_y = sum_z = 0.0
         sample_count = 0
 
-        last_time = time.monotonic()
-        start_time = time.monotonic()
+        start_time = last_time = time.monotonic()
+        self.rate.reset()
         timeout = 5.0
 
         while current_angle < target_angle:
@@ -149,25 +167,32 @@ class MovementCheck:
                 print("   [WARNING] Turn Timeout! Gyro might be unresponsive.")
                 break
 
-            # 1. Get Converted (for Yaw Integration)
-            reading = self.hw.read_imu_converted()
+            # One bus read serves both yaw integration and axis analysis
+            accel, gyro = self.hw.read_imu_raw()
+
+            # 1. Converted (for Yaw Integration)
+            reading = self.hw.convert_imu(accel, gyro)
             rate = reading.yaw_rate
             current_angle += rate * dt
 
-            # 2. Get Raw (for Axis Analysis)
-            _, gyro = self.hw.read_imu_raw()
-            for k in all_axes:
-                rate_sums[k] += abs(gyro[k])
+            # 2. Raw (for Axis Analysis)
+            sum_x += abs(gyro["x"])
+            sum_y += abs(gyro["y"])
+            sum_z += abs(gyro["z"])
             sample_count += 1
 
-            time.sleep(0.01)
+            self.rate.sleep()
 
         self.hw.stop()
         print(f"   Done. Measured Turn: {current_angle:.1f} deg")
 
         # Analysis
         if sample_count > 0:
-            avg_rates = {k: rate_sums[k]/sample_count for k in all_axes}
+            avg_rates = {
+                "x": sum_x / sample_count,
+                "y": sum_y / sample_count,
+                "z": sum_z / sample_count,
+            }
             _, _, success = analyze_dominance(avg_rates, "Yaw Rate", expected_axis=yaw_axis)
         else:
             print("   [ERROR] No samples collected?")
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
 from ..config import RobotConfig
 from ..hardware.robot_hardware import RobotHardware
@@ -15,16 +15,18 @@ class MotionRequest:
     turn_rate: float = 0.0  # -1.0 to 1.0 (Left/Right)
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True)
 class BalanceTelemetry:
     """
     Tier 1 -> Tier 2/3 Data Interface.
+    BalanceCore refills one instance every step; it is valid until the next update().
     """
     pitch_angle: float
     pitch_rate: float
     yaw_rate: float
     motor_output: float
     crashed: bool
+    ang_accel: float = 0.0  # deg/s^2, from consecutive gyro rates
 
 
 class TuningParams:
@@ -81,11 +83,24 @@ class BalanceCore:
         self.hw.init()
 
         # Control
-        self.pid = PIDController(config.pid)
+        # The controller owns its gains: tuning pushed in each step must not write
+        # through to config.pid (e.g. the kick-up's temporary stiff catch gains).
+        self.pid = PIDController(replace(config.pid))
+        self._gains = self.pid.params
         self.filter = ComplementaryFilter(config.complementary_alpha)
 
+        # Constant after init (hoisted out of the per-tick attribute chain)
+        self._yaw_factor = config.control.yaw_correction_factor
+        self._crash_hi = config.crash_angle
+        self._crash_lo = -config.crash_angle
+        # Live object: the balance finder moves target_angle at runtime, so keep the
+        # reference (one hop) rather than a copy of the value.
+        self._setpoint = config.pid
+
         # State
         self.pitch = 0.0
+        self._last_pitch_rate = 0.0
+        self._telemetry = BalanceTelemetry(0.0, 0.0, 0.0, 0.0, False)
 
     def set_i2c_retries(self, retries: int) -> None:
         """Set the I2C retry count for the motor driver."""
@@ -96,7 +111,7 @@ class BalanceCore:
         motion: MotionRequest,
         tuning: TuningParams,
         loop_delta_time: float,
-        battery_compensation: float = 1.0,
+        battery_gain: float = 1.0,
     ) -> BalanceTelemetry:
         """
         Execute one reflex step.
@@ -104,24 +119,27 @@ class BalanceCore:
         :param motion: Desired movement (Velocity, Turn).
         :param tuning: Current PID gains and balance offset.
         :param loop_delta_time: Time elapsed since last step.
-        :param battery_compensation: Multiplier to account for voltage drop (1.0 = Full, <1.0 = Low).
+        :param battery_gain: Motor output multiplier for voltage drop (1.0 = Full, >1.0 = Low).
+            This is the reciprocal of BatteryEstimator.compensation_factor.
         :return: Telemetry for higher tiers.
         """
         # 1. Read Physics
+        # Unpack once: everything below is plain scalar math on locals.
         reading = self.hw.read_imu_converted()
+        pitch_rate = reading.pitch_rate
+        yaw_rate = reading.yaw_rate
 
         # 2. Update State Estimation
-        self.pitch = self.filter.update(
-            reading.pitch_angle, reading.pitch_rate, loop_delta_time
+        pitch = self.pitch = self.filter.update(
+            reading.pitch_angle, pitch_rate, loop_delta_time
         )
 
         # 3. Apply Tuning (Tier 2 Adaptation)
-        # We update the PID controller's params dynamically
-        # Ideally, we wouldn't mutate this every frame if it's slow,
-        # but Python property assignment is fast enough.
-        self.pid.params.kp = tuning.kp
-        self.pid.params.ki = tuning.ki
-        self.pid.params.kd = tuning.kd
+        # Plain stores into the controller's private gains; cheaper than comparing first.
+        gains = self._gains
+        gains.kp = tuning.kp
+        gains.ki = tuning.ki
+        gains.kd = tuning.kd
 
         # 4. Calculate Targets
         # Map Velocity (-1 to 1) to Target Angle (-MAX to MAX)
@@ -130,28 +148,34 @@ class BalanceCore:
         velocity_tilt = motion.velocity * self.MAX_TILT_ANGLE
 
         target_angle = (
-            self.config.pid.target_angle  # Base mechanical setpoint
+            self._setpoint.target_angle  # Base mechanical setpoint
             + tuning.target_angle_offset  # Adaptation offset
             + velocity_tilt               # Intentional tilt
         )
 
+        telemetry = self._telemetry
+        telemetry.pitch_angle = pitch
+        telemetry.pitch_rate = pitch_rate
+        telemetry.yaw_rate = yaw_rate
+        telemetry.ang_accel = (
+            (pitch_rate - self._last_pitch_rate) / loop_delta_time
+            if loop_delta_time > 0 else 0.0
+        )
+        self._last_pitch_rate = pitch_rate
+
         # 5. Safety Cutoff
-        if abs(self.pitch) > self.config.crash_angle:
+        if pitch > self._crash_hi or pitch < self._crash_lo:
             self.hw.stop()
             self.pid.reset()  # Reset integral windup on crash
-            return BalanceTelemetry(
-                pitch_angle=self.pitch,
-                pitch_rate=reading.pitch_rate,
-                yaw_rate=reading.yaw_rate,
-                motor_output=0.0,
-                crashed=True
-            )
+            telemetry.motor_output = 0.0
+            telemetry.crashed = True
+            return telemetry
 
         # 6. Calculate Control Output
-        error = self.pitch - target_angle
+        error = pitch - target_angle
 
         pid_output = self.pid.update(
-            error, loop_delta_time, measurement_rate=reading.pitch_rate
+            error, loop_delta_time, measurement_rate=pitch_rate
         )
 
         # 7. Apply Turning
@@ -171,28 +195,20 @@ class BalanceCore:
         # Stabilization: -reading.yaw_rate * CorrectionFactor
 
         turn_cmd = motion.turn_rate * 30.0  # Arbitrary gain for now
-        yaw_damping = -reading.yaw_rate * self.config.control.yaw_correction_factor
+        yaw_damping = -yaw_rate * self._yaw_factor
 
         total_turn = turn_cmd + yaw_damping
 
-        left_motor = pid_output + total_turn
-        right_motor = pid_output - total_turn
-
         # 8. Actuate
         # Apply Battery Compensation
-        if battery_compensation > 0:
-            left_motor /= battery_compensation
-            right_motor /= battery_compensation
-
-        self.hw.set_motors(left_motor, right_motor)
-
-        return BalanceTelemetry(
-            pitch_angle=self.pitch,
-            pitch_rate=reading.pitch_rate,
-            yaw_rate=reading.yaw_rate,
-            motor_output=pid_output, # Raw PID output (useful for battery estimation)
-            crashed=False
-        )
+        drive = pid_output * battery_gain
+        total_turn *= battery_gain
+
+        self.hw.set_motors(drive + total_turn, drive - total_turn)
+
+        telemetry.motor_output = pid_output  # Raw PID output (useful for battery estimation)
+        telemetry.crashed = False
+        return telemetry
 
     def cleanup(self):
         self.hw.stop()
@@ -1,5 +1,4 @@
 from ..config import PIDParams
-from ..utils import clamp
 
 
 class PIDController:
@@ -9,6 +8,7 @@ class PIDController:
     Logic:
         Output = (Kp * Error) + (Ki * Integral) + (Kd * Derivative)
     """
+    __slots__ = ['params', 'integral', 'last_error']
 
     def __init__(self, params: PIDParams):
         """
@@ -38,38 +38,40 @@ class PIDController:
         Integral Strategy:
          - Accumulate error * dt.
          - Clamp sum to `integral_limit` (Anti-Windup).
+         - While Ki is zero the integral is held rather than accumulated, so it
+           cannot wind up unseen and kick in when the tuner introduces Ki.
 
         :param error: Current error (Target - Measured).
         :param loop_delta_time: Time elapsed since last update (seconds).
         :param measurement_rate: (Optional) Rate of change of the process variable.
         :return: Computed control output.
         """
-        self.integral += error * loop_delta_time
-        # Anti-windup
-        limit = self.params.integral_limit
-        self.integral = clamp(self.integral, -limit, limit)
+        params = self.params
+
+        integral = self.integral
+        if params.ki != 0.0:
+            # Anti-windup (inline compares: this runs every control tick)
+            limit = params.integral_limit
+            integral += error * loop_delta_time
+            if integral > limit:
+                integral = limit
+            elif integral < -limit:
+                integral = -limit
+            self.integral = integral
 
         if measurement_rate is not None:
             # Derivative on Measurement
             # d(Error)/dt = d(Setpoint - Process)/dt
             # If Setpoint is constant, d(Error)/dt = -d(Process)/dt
             derivative = -measurement_rate
-        else:
+        elif loop_delta_time > 0:
             # Derivative on Error
-            derivative = (
-                (error - self.last_error) / loop_delta_time
-                if loop_delta_time > 0
-                else 0.0
-            )
-
-        output = (
-            (self.params.kp * error)
-            + (self.params.ki * self.integral)
-            + (self.params.kd * derivative)
-        )
+            derivative = (error - self.last_error) / loop_delta_time
+        else:
+            derivative = 0.0
 
         self.last_error = error
-        return output
+        return params.kp * error + params.ki * integral + params.kd * derivative
 
     def reset(self) -> None:
         """
@@ -1,7 +1,13 @@
+import os
 import sys
 import time
+import ctypes
 import math
+import queue
+import atexit
+import threading
 import logging
+import logging.handlers
 from pathlib import Path
 from typing import TypedDict
 from collections import deque
@@ -9,7 +15,23 @@ from collections import deque
 logger = logging.getLogger(__name__)
 
 FORCE_CALIB_FILE = Path("force_calibration.txt")
+MCL_CURRENT = 1
+MCL_FUTURE = 2
 _CAPTURE_HANDLER = None
+# Stack size for threads started after enable_realtime(); with MCL_FUTURE each
+# stack is locked and fully populated, and the helpers only need a shallow one.
+HELPER_THREAD_STACK = 512 * 1024
+_LOG_LISTENER: logging.handlers.QueueListener | None = None
+LOG_FORMAT = "%(asctime)s [%(levelname)s] %(message)s"
+LOG_DATEFMT = "%H:%M:%S"
+
+# Pre-bound for RateLimiter.sleep (one global load per call instead of two lookups)
+_monotonic_ns = time.monotonic_ns
+_sleep = time.sleep
+
+# Pre-bound for calculate_pitch (runs twice per control tick)
+_atan2 = math.atan2
+RAD_TO_DEG = 180.0 / math.pi
 
 
 class LogCaptureHandler(logging.Handler):
@@ -18,9 +40,7 @@ class LogCaptureHandler(logging.Handler):
     def __init__(self, capacity: int = 50):
         super().__init__()
         self.buffer = deque(maxlen=capacity)
-        self.setFormatter(
-            logging.Formatter("%(asctime)s [%(levelname)s] %(message)s", datefmt="%H:%M:%S")
-        )
+        self.setFormatter(logging.Formatter(LOG_FORMAT, datefmt=LOG_DATEFMT))
 
     def emit(self, record):
         try:
@@ -30,6 +50,32 @@ class LogCaptureHandler(logging.Handler):
             self.handleError(record)
 
 
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that enqueues the record untouched.
+
+    The stock prepare() formats the record (msg % args, traceback text) and
+    copies it on the logging thread so it can be pickled; the queue here is
+    in-process, so all of that is left to the listener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class _DemotedQueueListener(logging.handlers.QueueListener):
+    """
+    QueueListener whose thread runs at normal priority.
+
+    get_captured_logs() restarts the listener to drain it, possibly after
+    enable_realtime(); the new thread would otherwise inherit SCHED_FIFO.
+    """
+
+    def _monitor(self) -> None:
+        demote_thread()
+        super()._monitor()
+
+
 class Vector3(TypedDict):
     """Type definition for a 3D vector (x, y, z)."""
 
@@ -46,6 +92,7 @@ class ComplementaryFilter:
     Formula:
         Angle = alpha * (Angle + GyroRate * dt) + (1 - alpha) * AccelAngle
     """
+    __slots__ = ['alpha', 'beta', 'angle']
 
     def __init__(self, alpha: float):
         """
@@ -54,6 +101,7 @@ class ComplementaryFilter:
                       Example: 0.98 means 98% Gyro, 2% Accel.
         """
         self.alpha = alpha
+        self.beta = 1.0 - alpha  # Accel weight, precomputed for the per-tick update
         self.angle = 0.0
 
     def update(self, new_angle: float, rate: float, loop_delta_time: float) -> float:
@@ -64,38 +112,72 @@ class ComplementaryFilter:
         :param loop_delta_time: Time delta in seconds.
         :return: The filtered angle.
         """
-        self.angle = (self.alpha * (self.angle + rate * loop_delta_time)) + (
-            (1.0 - self.alpha) * new_angle
-        )
-        return self.angle
+        angle = self.alpha * (self.angle + rate * loop_delta_time) + self.beta * new_angle
+        self.angle = angle
+        return angle
 
 
 class RateLimiter:
     """
     Loop Frequency Regulator.
     Ensures the control loop runs at a consistent predictable speed (e.g. 100Hz).
+
+    Ticks are scheduled on an absolute grid (next deadline += period), so sleep
+    overshoot does not accumulate as drift. On Python 3.11+ `time.sleep` is
+    itself implemented with clock_nanosleep(CLOCK_MONOTONIC, TIMER_ABSTIME).
+
+    With a spin margin, the last `spin` seconds before a deadline are busy-waited
+    so the scheduler's wake-up latency does not land on the tick.
+
+    The grid is kept in integer nanoseconds (time.monotonic_ns), so deadlines
+    do not pick up float rounding over long runs.
     """
+    __slots__ = ['period', 'spin', '_period_ns', '_spin_ns', 'next_ns', 'overruns', '_slip_log']
 
-    def __init__(self, frequency: float):
+    def __init__(self, frequency: float, spin: float = 0.0):
         """
         Initialize the rate limiter.
         :param frequency: Target frequency in Hz.
+        :param spin: Seconds before each deadline to busy-wait instead of sleep.
         """
         self.period = 1.0 / frequency
-        self.next_time = time.monotonic()
+        self.spin = spin
+        self._period_ns = round(1e9 / frequency)
+        self._spin_ns = round(spin * 1e9)
+        self.next_ns = _monotonic_ns()
+        self.overruns = 0
+        self._slip_log = LogThrottler(1.0)
 
     def sleep(self) -> None:
         """
-        Sleep for the remainder of the current period.
+        Sleep until the next deadline on the grid.
+        If the loop fell behind by more than a full period, the grid is
+        re-anchored to now rather than bursting through the backlog.
         """
-        self.next_time += self.period
-        sleep_time = self.next_time - time.monotonic()
-        if sleep_time > 0:
-            time.sleep(sleep_time)
+        next_ns = self.next_ns + self._period_ns
+        self.next_ns = next_ns
+        now = _monotonic_ns()
+        remaining = next_ns - now
+        if remaining > 0:
+            spin_ns = self._spin_ns
+            if remaining > spin_ns:
+                _sleep((remaining - spin_ns) * 1e-9)
+            if spin_ns:
+                while _monotonic_ns() < next_ns:
+                    pass
+        elif remaining < -self._period_ns:
+            self.overruns += 1
+            self.next_ns = now
+            if self._slip_log.should_log():
+                logger.debug(
+                    "Loop slip: %.1f ms behind, re-anchored (%d overruns)",
+                    -remaining * 1e-6,
+                    self.overruns,
+                )
 
     def reset(self) -> None:
         """Reset the internal timer to current time (e.g., after a pause)."""
-        self.next_time = time.monotonic()
+        self.next_ns = _monotonic_ns()
 
 
 class LogThrottler:
@@ -155,48 +237,114 @@ def calculate_pitch(accel_y: float, accel_z: float) -> float:
     :param accel_z: Acceleration along the vertical axis.
     :return: Angle in degrees.
     """
-    return math.degrees(math.atan2(accel_y, accel_z))
+    return _atan2(accel_y, accel_z) * RAD_TO_DEG
 
 
 def setup_logging(level: int = logging.INFO) -> None:
     """
     Configure standard logging format.
+
+    Records are only enqueued on the calling thread (unformatted, see
+    _DeferredQueueHandler); a QueueListener thread does the message formatting
+    and console/capture writes, so a slow terminal or SSH session can never
+    stall the control loop. Log arguments should therefore be values that are
+    not mutated afterwards.
+
     :param level: Logging verbosity (default INFO).
     """
-    global _CAPTURE_HANDLER
-    logging.basicConfig(
-        level=level,
-        format="%(asctime)s [%(levelname)s] %(message)s",
-        datefmt="%H:%M:%S",
-    )
-
-    # Attach capture handler to root logger
+    global _CAPTURE_HANDLER, _LOG_LISTENER
     root = logging.getLogger()
-    if _CAPTURE_HANDLER is None:
-        _CAPTURE_HANDLER = LogCaptureHandler()
-        root.addHandler(_CAPTURE_HANDLER)
+    root.setLevel(level)
+    if _LOG_LISTENER is not None:
+        return
+
+    console = logging.StreamHandler()
+    console.setFormatter(logging.Formatter(LOG_FORMAT, datefmt=LOG_DATEFMT))
+    _CAPTURE_HANDLER = LogCaptureHandler()
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _LOG_LISTENER = _DemotedQueueListener(log_queue, console, _CAPTURE_HANDLER)
+    _LOG_LISTENER.start()
+    atexit.register(_LOG_LISTENER.stop)
+    root.addHandler(_DeferredQueueHandler(log_queue))
 
 
 def get_captured_logs() -> str:
     """Retrieve recent logs from the capture buffer."""
     if _CAPTURE_HANDLER:
+        # Drain anything still queued before reading the buffer
+        _LOG_LISTENER.stop()
+        _LOG_LISTENER.start()
         return "\n".join(_CAPTURE_HANDLER.buffer)
     return "No logs captured."
 
 
-def check_force_calibration_flag() -> bool:
+def enable_realtime(priority: int = 20) -> None:
+    """
+    Best-effort real-time tuning for the control process (Linux only).
+     1. Pin to the last CPU (the usual `isolcpus` choice) to avoid migrations.
+     2. mlockall() so the loop never stalls on a page fault.
+     3. Switch to SCHED_FIFO so background daemons cannot preempt a tick.
+    Each step needs root; failures are logged and otherwise ignored.
+
+    The policy applies to the calling thread and is inherited by threads it
+    starts later; helper threads must call demote_thread() first thing.
+
+    :param priority: SCHED_FIFO priority (1-99).
+    """
+    if not sys.platform.startswith("linux"):
+        return
+
+    cpus = os.sched_getaffinity(0)
+    if len(cpus) > 1:
+        try:
+            os.sched_setaffinity(0, {max(cpus)})
+        except OSError as e:
+            logger.warning(f"Could not pin to CPU {max(cpus)}: {e}")
+
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        if libc.mlockall(MCL_CURRENT | MCL_FUTURE) != 0:
+            raise OSError(ctypes.get_errno(), "mlockall failed")
+        threading.stack_size(HELPER_THREAD_STACK)
+    except OSError as e:
+        logger.warning(f"Could not lock memory: {e}")
+
+    try:
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+    except OSError as e:
+        logger.warning(f"Could not enable SCHED_FIFO: {e}")
+
+
+def demote_thread() -> None:
+    """
+    Return the calling thread to normal (SCHED_OTHER) scheduling.
+    For helper threads (LED blink, config I/O) started after enable_realtime(),
+    which would otherwise inherit SCHED_FIFO at the control loop's priority and
+    could not be preempted by it on a single-core Pi.
+    """
+    if not sys.platform.startswith("linux"):
+        return
+    try:
+        os.sched_setscheduler(0, os.SCHED_OTHER, os.sched_param(0))
+    except OSError as e:
+        logger.warning(f"Could not demote helper thread: {e}")
+
+
+def check_force_calibration_flag(cli_flag: bool = False) -> bool:
     """
     Check for external triggers to force a calibration run.
     Triggers:
      1. Existence of 'force_calibration.txt'.
-     2. '--force-calibration' command line arg.
+     2. '--force-calibration' command line arg (parsed by main, passed as cli_flag).
 
+    :param cli_flag: Value of the parsed --force-calibration option.
     :return: True if calibration is requested.
     """
     if FORCE_CALIB_FILE.exists():
         logger.info(f"Force calibration file found: {FORCE_CALIB_FILE}")
         return True
-    if "--force-calibration" in sys.argv:
+    if cli_flag:
         logger.info("Force calibration flag found")
         return True
     return False
@@ -216,14 +364,21 @@ def analyze_dominance(
     :param threshold: Minimum ratio between winner and runner-up.
     :return: Tuple (winner_axis, ratio, is_success)
     """
-    sorted_items = sorted(data.items(), key=lambda x: abs(x[1]), reverse=True)
-    winner, winner_val = sorted_items[0]
-    runner, runner_val = sorted_items[1]
-
-    ratio = abs(winner_val) / (abs(runner_val) + 1e-9)
+    # Single pass for the top two magnitudes (ties keep dict order, like a stable sort)
+    winner = runner = ""
+    winner_val = runner_val = -1.0
+    for axis, value in data.items():
+        mag = abs(value)
+        if mag > winner_val:
+            runner, runner_val = winner, winner_val
+            winner, winner_val = axis, mag
+        elif mag > runner_val:
+            runner, runner_val = axis, mag
+
+    ratio = winner_val / (runner_val + 1e-9)
 
     print(
-        f"   [Analysis] {label}: Winner={winner.upper()} ({abs(winner_val):.2f}) vs Runner={runner.upper()} ({abs(runner_val):.2f}) -> Ratio: {ratio:.1f}"
+        f"   [Analysis] {label}: Winner={winner.upper()} ({winner_val:.2f}) vs Runner={runner.upper()} ({runner_val:.2f}) -> Ratio: {ratio:.1f}"
     )
 
     success = True
@@ -37,10 +37,14 @@ def test_balance_core_update_with_mutable_tuning_params():
         telemetry = core.update(motion, tuning, loop_delta_time=0.01)
 
         assert isinstance(telemetry, BalanceTelemetry)
+        # Constant gyro rate -> no angular acceleration
+        assert telemetry.ang_accel == 0.0
         # Check if PID params were updated from tuning params
         assert core.pid.params.kp == 2.0
         assert core.pid.params.ki == 0.1
         assert core.pid.params.kd == 0.01
+        # Tuning is applied to the controller's own copy, not the saved config
+        assert config.pid.kp == 1.0
 
         # 2. Modify TuningParams in place (Optimization verification)
         tuning.kp = 3.0
@@ -55,6 +59,10 @@ def test_balance_core_update_with_mutable_tuning_params():
         # target_angle = config.pid.target_angle + tuning.target_angle_offset + velocity_tilt
         # We can't easily check target_angle directly as it is local variable, but we can verify it ran without error.
 
+        # A zero-length step (first tick, clock hiccup) must not divide by zero
+        telemetry = core.update(motion, tuning, loop_delta_time=0.0)
+        assert telemetry.ang_accel == 0.0
+
         print("Integration test passed!")
 
 if __name__ == "__main__":
@@ -36,6 +36,7 @@ def test_battery_estimator_compensation():
     # Should be significantly less than 1.0
     assert factor < 0.9
     assert factor >= 0.5 # clamped
+    assert estimator.inv_compensation == 1.0 / factor
 
 def test_battery_estimator_deadzone():
     """Test that small PWMs are ignored."""
@@ -0,0 +1,46 @@
+import os
+from unittest.mock import patch
+from balance_bot.config import RobotConfig, CONFIG_FILE
+
+def test_save_skips_unchanged_config(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    cfg = RobotConfig.load()
+    cfg.save()
+    os.utime(CONFIG_FILE, ns=(0, 0))
+
+    # Identical content: file is left untouched
+    cfg.save()
+    assert CONFIG_FILE.stat().st_mtime_ns == 0
+
+    # Changed content: file is rewritten
+    cfg.pid.kp = 12.5
+    cfg.save()
+    assert CONFIG_FILE.stat().st_mtime_ns != 0
+    assert RobotConfig.load().pid.kp == 12.5
+
+def test_save_replaces_file_atomically(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    CONFIG_FILE.write_text("{ truncated")
+
+    cfg = RobotConfig.load()
+    cfg.pid.kd = 0.75
+    cfg.save()
+
+    # No temp file is left behind and the result parses
+    assert sorted(p.name for p in tmp_path.iterdir()) == [CONFIG_FILE.name]
+    assert RobotConfig.load().pid.kd == 0.75
+
+def test_save_fsyncs_before_replace(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    cfg = RobotConfig.load()
+    cfg.pid.kp = 3.5
+
+    calls = []
+    with patch("balance_bot.config.os.fsync", side_effect=lambda fd: calls.append("fsync")), \
+         patch("balance_bot.config.os.replace", side_effect=lambda *a: calls.append("replace") or os.rename(*a)):
+        cfg.save()
+
+    # File data first, then the rename, then the directory entry
+    assert calls == ["fsync", "replace", "fsync"]
+    assert RobotConfig.load().pid.kp == 3.5
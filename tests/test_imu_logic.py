@@ -1,6 +1,12 @@
 import math
+import struct
 from unittest.mock import MagicMock
-from balance_bot.hardware.robot_hardware import RobotHardware, IMUReading
+from balance_bot.hardware.robot_hardware import (
+    RobotHardware,
+    IMUReading,
+    MPU6050Adapter,
+    MPU6050_DATA_START,
+)
 from balance_bot.enums import Axis
 
 # We need to mock the imports inside RobotHardware
@@ -98,3 +104,76 @@ def test_imu_processing_sideways(monkeypatch):
 
     assert math.isclose(reading.pitch_angle, 45.0, abs_tol=0.1)
     assert math.isclose(reading.pitch_rate, 5.0)
+
+def test_imu_reading_reused(monkeypatch):
+    """read_imu_converted fills one preallocated IMUReading instead of allocating per tick."""
+    monkeypatch.setenv("ALLOW_MOCK_FALLBACK", "1")
+    hw = RobotHardware(0, 1)
+    hw.sensor = MagicMock()
+    hw.sensor.get_accel_data.return_value = {"x": 0.0, "y": 0.0, "z": 9.8}
+    hw.sensor.get_gyro_data.return_value = {"x": 1.0, "y": 0.0, "z": 0.0}
+
+    first = hw.read_imu_converted()
+    hw.sensor.get_gyro_data.return_value = {"x": 2.0, "y": 0.0, "z": 0.0}
+    second = hw.read_imu_converted()
+
+    assert first is second
+    assert math.isclose(second.pitch_rate, 2.0)
+
+def test_mpu6050_adapter_burst_read():
+    sensor = MagicMock()
+    sensor.address = 0x68
+    sensor.read_accel_range.return_value = 2
+    sensor.read_gyro_range.return_value = 250
+    frame = struct.pack(">7h", 0, 8192, 16384, 0, 131, -262, 0)
+    sensor.bus.read_i2c_block_data.return_value = list(frame)
+
+    adapter = MPU6050Adapter(sensor)
+    accel = adapter.get_accel_data()
+    gyro = adapter.get_gyro_data()
+
+    # One transaction serves both accel and gyro
+    sensor.bus.read_i2c_block_data.assert_called_once_with(0x68, MPU6050_DATA_START, 14)
+    assert math.isclose(accel["y"], 9.80665 / 2)
+    assert math.isclose(accel["z"], 9.80665)
+    assert math.isclose(gyro["x"], 1.0)
+    assert math.isclose(gyro["y"], -2.0)
+
+    # A standalone gyro read fetches its own frame
+    adapter.get_gyro_data()
+    assert sensor.bus.read_i2c_block_data.call_count == 2
+
+def test_set_motors_saturates_and_maps_channels(monkeypatch):
+    monkeypatch.setenv("ALLOW_MOCK_FALLBACK", "1")
+
+    hw = RobotHardware(1, 0, invert_r=True)
+    hw.pz = MagicMock()
+
+    hw.set_motors(150.7, 42.9)
+    # Left -> channel 1 (clamped), right inverted -> channel 0 (truncated)
+    hw.pz.set_motors.assert_called_with(-42, 100)
+
+    hw.set_motors(-300.0, -300.0)
+    hw.pz.set_motors.assert_called_with(100, -100)
+
+def test_convert_imu_matches_read_imu_converted(monkeypatch):
+    monkeypatch.setenv("ALLOW_MOCK_FALLBACK", "1")
+
+    hw = RobotHardware(0, 1)
+    hw.sensor = MagicMock()
+    accel = {"x": 0.0, "y": 1.0, "z": 1.0}
+    gyro = {"x": 10.0, "y": 2.0, "z": 3.0}
+    hw.sensor.get_accel_data.return_value = accel
+    hw.sensor.get_gyro_data.return_value = gyro
+
+    read = hw.read_imu_converted()
+    expected = (read.pitch_angle, read.pitch_rate, read.yaw_rate, read.roll_angle, read.roll_rate)
+
+    hw.sensor.reset_mock()
+    converted = hw.convert_imu(accel, gyro)
+    # Pure conversion: no bus traffic
+    hw.sensor.get_accel_data.assert_not_called()
+    assert (
+        converted.pitch_angle, converted.pitch_rate, converted.yaw_rate,
+        converted.roll_angle, converted.roll_rate,
+    ) == expected
@@ -0,0 +1,39 @@
+import time
+from unittest.mock import patch
+from balance_bot.behavior.leds import LedController
+from balance_bot.config import LedConfig
+
+def test_led_thread_blinks_and_stops():
+    with patch.object(LedController, "_find_led_path", return_value=None):
+        led = LedController(LedConfig(setup_blink_interval=0.01, update_interval=0.005))
+
+    led.signal_setup()
+    with patch.object(led, "set_led", wraps=led.set_led) as set_led:
+        led.start()
+        time.sleep(0.1)
+        led.stop()
+        toggles = set_led.call_count
+        time.sleep(0.03)
+        # Blinking happened in the background, and nothing runs after stop()
+        assert toggles >= 2
+        assert set_led.call_count == toggles
+
+    led.signal_off()
+    assert not led.is_on
+
+def test_led_writes_through_persistent_fd(tmp_path):
+    brightness = tmp_path / "brightness"
+    brightness.write_text("0")
+    with patch.object(LedController, "_find_led_path", return_value=brightness):
+        led = LedController()
+
+    led.signal_ready()
+    assert brightness.read_text() == "1"
+    led.signal_off()
+    assert brightness.read_text() == "0"
+
+    led.close()
+    assert led._led_fd is None
+    # Writes after close are dropped rather than raising
+    led.set_led(True)
+    assert brightness.read_text() == "0"
@@ -0,0 +1,18 @@
+import math
+from balance_bot.hardware.mocks import MockMPU6050
+
+def test_mock_pitch_file_is_polled_not_read_per_sample(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    imu = MockMPU6050(0x68)
+
+    # No override file: upright
+    accel = imu.get_accel_data()
+    assert math.isclose(math.degrees(math.atan2(accel["y"], accel["z"])), 0.0, abs_tol=1e-9)
+
+    # A new pitch is only picked up on the next poll
+    (tmp_path / MockMPU6050.PITCH_FILE).write_text("30")
+    assert imu.get_accel_data() is accel
+
+    imu._next_poll = 0.0
+    accel = imu.get_accel_data()
+    assert math.isclose(math.degrees(math.atan2(accel["y"], accel["z"])), 30.0)
@@ -57,6 +57,53 @@ class TestPiconZeroDriver(unittest.TestCase):
         self.assertTrue(found_motor0, "Did not find write for Motor 0 with 50")
         self.assertTrue(found_motor1, "Did not find write for Motor 1 with -50")
 
+    def test_set_motors_skips_unchanged_channels(self):
+        """Repeated values are not re-sent; stop() and init() resync the cache."""
+        bus = self.pz_module.bus
+
+        self.adapter.set_motors(100, 20)
+        bus.write_byte_data.reset_mock()
+
+        # Only motor 1 changed
+        self.adapter.set_motors(100, 30)
+        bus.write_byte_data.assert_called_once_with(0x22, 1, 30)
+
+        # After stop(), both channels are known to be 0
+        self.adapter.stop()
+        bus.write_byte_data.reset_mock()
+        self.adapter.set_motors(0, 0)
+        bus.write_byte_data.assert_not_called()
+
+        # After init() (board reset), the next command is always written
+        self.adapter.init()
+        bus.write_byte_data.reset_mock()
+        self.adapter.set_motors(0, 0)
+        self.assertEqual(bus.write_byte_data.call_count, 2)
+
+    def test_set_motors_resends_after_failed_write(self):
+        """A write that raised is not cached; the next command retries it."""
+        bus = self.pz_module.bus
+        self.pz_module.RETRIES = 1
+
+        bus.write_byte_data.side_effect = OSError
+        with self.assertRaises(OSError):
+            self.adapter.set_motors(40, 40)
+
+        bus.write_byte_data.side_effect = None
+        bus.write_byte_data.reset_mock()
+        self.adapter.set_motors(40, 40)
+        self.assertEqual(bus.write_byte_data.call_count, 2)
+
+    def test_set_motors_periodic_resync(self):
+        """Unchanged channels are re-sent every RESYNC_INTERVAL calls."""
+        bus = self.pz_module.bus
+        self.adapter.set_motors(10, 10)
+        bus.write_byte_data.reset_mock()
+
+        for _ in range(self.adapter.RESYNC_INTERVAL):
+            self.adapter.set_motors(10, 10)
+        self.assertEqual(bus.write_byte_data.call_count, 2)
+
     def test_bus_switching(self):
         """Test that initializing with a different bus updates the global pz.bus."""
         # Initialize with bus 0
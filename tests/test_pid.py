@@ -0,0 +1,43 @@
+from balance_bot.config import PIDParams
+from balance_bot.reflex.pid import PIDController
+
+def test_pid_terms():
+    pid = PIDController(PIDParams(kp=2.0, ki=1.0, kd=0.5, integral_limit=20.0))
+
+    # P + I (error*dt) + D on measurement (-rate)
+    out = pid.update(3.0, 0.1, measurement_rate=4.0)
+    assert abs(out - (2.0 * 3.0 + 1.0 * 0.3 + 0.5 * -4.0)) < 1e-9
+
+def test_pid_derivative_on_error():
+    pid = PIDController(PIDParams(kp=0.0, ki=0.0, kd=1.0))
+    pid.update(1.0, 0.1)
+    assert abs(pid.update(2.0, 0.1) - 10.0) < 1e-9
+
+def test_pid_integral_anti_windup():
+    pid = PIDController(PIDParams(kp=0.0, ki=1.0, kd=0.0, integral_limit=5.0))
+
+    for _ in range(100):
+        pid.update(10.0, 0.1, measurement_rate=0.0)
+    assert pid.integral == 5.0
+
+    for _ in range(100):
+        pid.update(-10.0, 0.1, measurement_rate=0.0)
+    assert pid.integral == -5.0
+
+    pid.reset()
+    assert pid.integral == 0.0
+
+def test_pid_zero_ki_holds_integral():
+    # PD gains as left by discovery: the D-term still applies
+    params = PIDParams(kp=2.0, ki=0.0, kd=0.5)
+    pid = PIDController(params)
+
+    for _ in range(10):
+        assert pid.update(3.0, 0.1, measurement_rate=4.0) == 6.0 - 2.0
+    assert pid.integral == 0.0
+    assert pid.last_error == 3.0
+
+    # Introducing Ki starts integrating from a clean slate (no bump)
+    params.ki = 1.0
+    out = pid.update(3.0, 0.1, measurement_rate=0.0)
+    assert abs(out - (6.0 + 0.3)) < 1e-9
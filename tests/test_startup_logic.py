@@ -1,11 +1,12 @@
 import unittest
 from unittest.mock import MagicMock, patch
 import sys
+import gc
 
 # Adjust path to import src
 sys.path.insert(0, "src")
 
-from balance_bot.behavior.agent import Agent
+from balance_bot.behavior.agent import Agent, ShutdownRequested
 
 class TestAgentStartup(unittest.TestCase):
 
@@ -107,5 +108,93 @@ class TestAgentStartup(unittest.TestCase):
         # Assert
         agent._incremental_kickup.assert_not_called()
 
+    def test_force_calibration_arg_triggers_discovery(self):
+        # Arrange
+        self.mock_config_file.exists.return_value = True # Saved config
+
+        agent = Agent(force_calibration=True)
+        self.assertTrue(agent.first_run)
+
+        agent._perform_discovery = MagicMock()
+        agent.running = False
+
+        # Act
+        agent.run()
+
+        # Assert
+        agent._perform_discovery.assert_called_once()
+
+    def test_shutdown_signal_skips_startup(self):
+        # Arrange
+        self.mock_config_file.exists.return_value = False # Would run discovery
+
+        agent = Agent()
+        agent._perform_discovery = MagicMock()
+
+        # Act
+        agent._request_shutdown(15, None) # SIGTERM
+        agent.run()
+
+        # Assert
+        self.assertFalse(agent.running)
+        agent._perform_discovery.assert_not_called()
+        self.mock_core_instance.cleanup.assert_called_once()
+
+    def test_run_restores_gc_state(self):
+        agent = Agent()
+        self.mock_core_instance.pitch = 0.0
+        agent.running = False
+
+        agent.run()
+
+        self.assertTrue(gc.isenabled())
+        self.assertEqual(gc.get_freeze_count(), 0)
+
+    def test_config_snapshot_is_detached(self):
+        from balance_bot.config import RobotConfig, PIDParams
+
+        agent = Agent()
+        agent.config = RobotConfig(pid=PIDParams(kp=5.0))
+
+        snapshot = agent._snapshot_config()
+        agent.config.pid.kp = 7.0
+        agent.config.control.kickup_power = 99.0
+
+        self.assertEqual(snapshot.pid.kp, 5.0)
+        self.assertNotEqual(snapshot.control.kickup_power, 99.0)
+
+    def test_background_save_failure_is_logged(self):
+        from balance_bot.behavior.agent import _log_save_failure
+
+        agent = Agent()
+
+        def failing_save():
+            raise ValueError("not serializable")
+
+        future = agent.io_executor.submit(failing_save)
+        future.exception()  # Wait for the worker
+        with self.assertLogs("balance_bot.behavior.agent", level="ERROR") as logs:
+            future.add_done_callback(_log_save_failure)
+        agent.io_executor.shutdown(wait=True)
+
+        self.assertIn("not serializable", logs.output[0])
+
+    def test_shutdown_during_startup_is_not_an_error(self):
+        agent = Agent()
+        self.mock_core_instance.pitch = -40.0
+        agent.running = False
+        self.assertRaises(ShutdownRequested, agent._incremental_flop, "FRONT")
+        self.assertRaises(ShutdownRequested, agent._incremental_kickup, 0.0, 30.0)
+
+        # run() stops quietly instead of logging "Discovery Failed"
+        self.mock_config_file.exists.return_value = False
+        agent = Agent()
+        agent.running = True
+        agent._perform_discovery = MagicMock(side_effect=ShutdownRequested)
+        with patch("balance_bot.behavior.agent.SYSTEM_TIMING", MagicMock(setup_wait=0.0)), \
+             self.assertNoLogs("balance_bot.behavior.agent", level="ERROR"):
+            agent.run()
+        self.mock_core_instance.cleanup.assert_called()
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,4 +1,4 @@
-from balance_bot.adaptation.tuner import ContinuousTuner
+from balance_bot.adaptation.tuner import ContinuousTuner, NO_ADJUSTMENT
 from balance_bot.config import TunerConfig
 
 def test_oscillation_detection():
@@ -65,3 +65,17 @@ def test_cooldown():
     assert kp == 0
     assert ki == 0
     assert kd == 0
+
+def test_no_adjustment_is_shared_sentinel():
+    tuner = ContinuousTuner(config=TunerConfig(analysis_interval=1), buffer_size=10)
+
+    # Buffer not yet full -> nothing to suggest
+    assert tuner.update(0.1) is NO_ADJUSTMENT
+    # Crash angle -> history reset, nothing to suggest
+    assert tuner.update(1000.0) is NO_ADJUSTMENT
+
+def test_zero_crossing_count():
+    tuner = ContinuousTuner(TunerConfig(), buffer_size=8)
+    # +->-, -->0, 0->+ (not counted: starts at zero), +->+
+    tuner.errors.extend([1.0, -2.0, 0.0, 3.0, 4.0])
+    assert tuner._count_zero_crossings() == 2
@@ -1,7 +1,12 @@
 import time
 import math
+import queue
+import logging
+import logging.handlers
+import pytest
+from balance_bot import utils
 from unittest.mock import patch
-from balance_bot.utils import clamp, RateLimiter, ComplementaryFilter, calculate_pitch, to_signed, LogThrottler
+from balance_bot.utils import clamp, RateLimiter, ComplementaryFilter, calculate_pitch, to_signed, LogThrottler, enable_realtime, setup_logging, get_captured_logs, demote_thread
 
 def test_clamp():
     assert clamp(10, 0, 5) == 5.0
@@ -50,6 +55,34 @@ def test_rate_limiter():
     # Should not be too slow either (allow 20% overhead)
     assert elapsed < 0.12
 
+def test_rate_limiter_overrun_reanchors(caplog):
+    limiter = RateLimiter(100)
+    limiter.reset()
+
+    # Stall for several periods
+    time.sleep(0.05)
+    with caplog.at_level(logging.DEBUG, logger="balance_bot.utils"):
+        limiter.sleep()
+    assert limiter.overruns == 1
+    assert "Loop slip" in caplog.text
+
+    # The next tick is scheduled one period from now, not from the stale grid
+    start = time.monotonic()
+    limiter.sleep()
+    assert time.monotonic() - start >= 0.009
+
+def test_rate_limiter_spin_hits_deadline():
+    limiter = RateLimiter(100, spin=0.002)
+    limiter.reset()
+    deadline = limiter.next_ns + 10_000_000
+
+    with patch("balance_bot.utils._sleep") as mock_sleep:
+        limiter.sleep()
+
+    # Coarse sleep stops short by the spin margin; the spin covers the rest
+    assert mock_sleep.call_args[0][0] < limiter.period - 0.002 + 1e-6
+    assert time.monotonic_ns() >= deadline
+
 def test_complementary_filter():
     alpha = 0.98
     cf = ComplementaryFilter(alpha)
@@ -111,6 +144,12 @@ def test_analyze_dominance():
     assert winner == 'y'
     assert success is False
 
+    # Negative values compare by magnitude; ties keep the first axis
+    data = {'x': 5.0, 'y': -50.0, 'z': 5.0}
+    winner, ratio, success = analyze_dominance(data, "Test5")
+    assert winner == 'y'
+    assert abs(ratio - 10.0) < 1e-5
+
 def test_log_throttler():
     with patch("time.monotonic") as mock_time:
         # Start at time 100.0
@@ -135,3 +174,58 @@ def test_log_throttler():
 
         # Immediate subsequent call should fail again
         assert throttler.should_log() is False
+
+def test_enable_realtime_tolerates_missing_privileges():
+    with patch("balance_bot.utils.sys.platform", "linux"), \
+         patch("balance_bot.utils.os.sched_getaffinity", return_value={0, 1, 2, 3}, create=True), \
+         patch("balance_bot.utils.os.sched_setaffinity", side_effect=PermissionError, create=True) as set_aff, \
+         patch("balance_bot.utils.ctypes.CDLL") as cdll, \
+         patch("balance_bot.utils.os.sched_setscheduler", side_effect=PermissionError, create=True):
+        cdll.return_value.mlockall.return_value = -1
+        enable_realtime()  # Must not raise
+    set_aff.assert_called_once_with(0, {3})
+
+@pytest.fixture
+def queued_logging():
+    setup_logging()
+    yield
+    # Don't leak the root handler and listener thread into later tests
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        if isinstance(handler, logging.handlers.QueueHandler):
+            root.removeHandler(handler)
+    utils._LOG_LISTENER.stop()
+    utils._LOG_LISTENER = None
+    utils._CAPTURE_HANDLER = None
+
+def test_logging_goes_through_queue_listener(queued_logging):
+    logging.getLogger("balance_bot.test").warning("queued %s", "record")
+    # get_captured_logs drains the listener before reading
+    assert "queued record" in get_captured_logs()
+
+def test_restarted_listener_demotes_itself(queued_logging):
+    with patch("balance_bot.utils.demote_thread") as demote:
+        get_captured_logs()  # Restarts the listener thread
+        utils._LOG_LISTENER.stop()
+    demote.assert_called_once_with()
+    utils._LOG_LISTENER.start()  # Leave it running for the fixture teardown
+
+def test_queue_handler_defers_formatting():
+    q = queue.SimpleQueue()
+    handler = utils._DeferredQueueHandler(q)
+    record = logging.LogRecord("t", logging.INFO, __file__, 1, "queued %s", ("record",), None)
+    handler.handle(record)
+
+    # Same record, message not merged on the logging thread
+    queued = q.get_nowait()
+    assert queued is record
+    assert queued.msg == "queued %s"
+    assert queued.args == ("record",)
+
+def test_demote_thread_sets_sched_other():
+    with patch("balance_bot.utils.sys.platform", "linux"), \
+         patch("balance_bot.utils.os.sched_setscheduler", create=True) as setsched:
+        demote_thread()
+    policy = setsched.call_args.args[1]
+    assert setsched.call_args.args[0] == 0
+    assert policy == utils.os.SCHED_OTHER